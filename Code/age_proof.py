@@ -1,9 +1,7 @@
+import hashlib
 import os
 from typing import ByteString
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-
 
 def generate_seed() -> ByteString:
     """
@@ -15,6 +13,27 @@ def generate_seed() -> ByteString:
     return os.urandom(16)
 
 
+def hash_chain(data: ByteString, iterations: int) -> ByteString:
+    """
+    Applies SHA3-256 to the given data the specified number of times.
+
+    The chain is what lets Peggy reveal an intermediate link as proof of
+    being at least a given age without revealing her actual age, so it
+    cannot be replaced by a single hash over the seed and age.
+
+    Args:
+        data (ByteString): The value at the start of the chain.
+        iterations (int): Number of times the hash is applied.
+
+    Returns:
+        ByteString: The value at the end of the chain.
+    """
+    sha3 = hashlib.sha3_256
+    for _ in range(iterations):
+        data = sha3(data).digest()
+    return data
+
+
 def calculate_proof(seed: ByteString, age_actual: int, age_to_prove: int) -> ByteString:
     """
     Calculates the proof based on the given seed and ages.
@@ -26,17 +45,13 @@ def calculate_proof(seed: ByteString, age_actual: int, age_to_prove: int) -> Byt
 
     Returns:
         ByteString: The calculated proof.
-    """
-    digest = hashes.Hash(hashes.SHA3_256(), backend=default_backend())
-    digest.update(seed)
-    proof = digest.finalize()
-
-    for _ in range(age_actual - age_to_prove):
-        digest = hashes.Hash(hashes.SHA3_256(), backend=default_backend())
-        digest.update(proof)
-        proof = digest.finalize()
 
-    return proof
+    Raises:
+        ValueError: If the age to prove is negative or exceeds the actual age.
+    """
+    if not 0 <= age_to_prove <= age_actual:
+        raise ValueError("Age to prove must be between 0 and the actual age.")
+    return hash_chain(seed, age_actual - age_to_prove + 1)
 
 
 def calculate_encrypted_age(seed: ByteString, age_actual: int) -> ByteString:
@@ -49,17 +64,13 @@ def calculate_encrypted_age(seed: ByteString, age_actual: int) -> ByteString:
 
     Returns:
         ByteString: The calculated encrypted age.
-    """
-    digest = hashes.Hash(hashes.SHA3_256(), backend=default_backend())
-    digest.update(seed)
-    encrypted_age = digest.finalize()
 
-    for _ in range(age_actual):
-        digest = hashes.Hash(hashes.SHA3_256(), backend=default_backend())
-        digest.update(encrypted_age)
-        encrypted_age = digest.finalize()
-
-    return encrypted_age
+    Raises:
+        ValueError: If the age is negative.
+    """
+    if age_actual < 0:
+        raise ValueError("Age cannot be negative.")
+    return hash_chain(seed, age_actual + 1)
 
 
 def verify_age(
@@ -75,13 +86,13 @@ def verify_age(
 
     Returns:
         ByteString: The verified age.
+
+    Raises:
+        ValueError: If the age is negative.
     """
-    verified_age = proof
-    for _ in range(age_to_prove):
-        digest = hashes.Hash(hashes.SHA3_256(), backend=default_backend())
-        digest.update(verified_age)
-        verified_age = digest.finalize()
-    return verified_age
+    if age_to_prove < 0:
+        raise ValueError("Age cannot be negative.")
+    return hash_chain(proof, age_to_prove)
 
 
 if __name__ == "__main__":
@@ -93,7 +104,11 @@ if __name__ == "__main__":
     seed: ByteString = generate_seed()
 
     # Calculate proof
-    proof: ByteString = calculate_proof(seed, age_actual, age_to_prove)
+    try:
+        proof: ByteString = calculate_proof(seed, age_actual, age_to_prove)
+    except ValueError:
+        print("You have not proven your age.")
+        raise SystemExit
 
     # Calculate encrypted age
     encrypted_age: ByteString = calculate_encrypted_age(seed, age_actual)
@@ -1,25 +1,74 @@
+import concurrent.futures
+import hashlib
 import secrets
 from typing import Tuple
 
+import gmpy2
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import rsa
 
+BACKEND = default_backend()
+_KEYGEN_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
+def _schedule_private_key() -> concurrent.futures.Future:
+    """
+    Schedules the generation of a 4096-bit RSA private key on the key pool.
+
+    :return: Future resolving to the generated private key.
+    """
+    return _KEYGEN_POOL.submit(
+        rsa.generate_private_key,
+        public_exponent=65537,
+        key_size=4096,
+        backend=BACKEND,
+    )
+
 
 class KeyPair:
     """Handles RSA key generation and storage."""
 
     def __init__(self):
         """Initializes KeyPair."""
+        self._next_key = None
         self.generate_keypair()
 
     def generate_keypair(self):
-        """Generates an RSA key pair."""
-        self.private_key = rsa.generate_private_key(
-            public_exponent=65537, key_size=4096, backend=default_backend()
-        )
-        self.public_key = self.private_key.public_key()
-        self.n = self.public_key.public_numbers().n
+        """Generates an RSA key pair, reusing a prefetched key if one is pending."""
+        self._pending_key = self._next_key or _schedule_private_key()
+        self._next_key = None
+        self._private_key = None
+
+    def prefetch_keypair(self):
+        """Starts generating the next RSA key pair in the background."""
+        if self._next_key is None:
+            self._next_key = _schedule_private_key()
+
+    def _resolve(self):
+        """Waits for the pending private key and derives the public values."""
+        if self._private_key is None:
+            self._private_key = self._pending_key.result()
+            self._public_key = self._private_key.public_key()
+            self._n = self._public_key.public_numbers().n
+
+    @property
+    def private_key(self) -> rsa.RSAPrivateKey:
+        """RSA private key."""
+        self._resolve()
+        return self._private_key
+
+    @property
+    def public_key(self) -> rsa.RSAPublicKey:
+        """RSA public key."""
+        self._resolve()
+        return self._public_key
+
+    @property
+    def n(self) -> int:
+        """RSA modulus."""
+        self._resolve()
+        return self._n
 
 
 class Hasher:
@@ -34,7 +83,7 @@ class Hasher:
         :param hash_algorithm: Hash algorithm to use.
         :return: Hash of the data.
         """
-        digest = hashes.Hash(hash_algorithm, backend=default_backend())
+        digest = hashes.Hash(hash_algorithm, backend=BACKEND)
         digest.update(data)
         return digest.finalize()
 
@@ -42,6 +91,10 @@ class Hasher:
 class FiatShamirIdentification:
     """Implements the Fiat-Shamir identification scheme."""
 
+    CHALLENGE_BYTES = 64
+    WINDOW_BITS = 5
+    WINDOW_TABLE_THRESHOLD = 8
+
     def __init__(self, password: str, key_pair: KeyPair):
         """
         Initializes the Fiat-Shamir identification process.
@@ -54,6 +107,64 @@ class FiatShamirIdentification:
         self.public_key = key_pair.public_key
         self.n = key_pair.n
         self.password_hash = Hasher.get_hash(password.encode())
+        self._n_mpz = gmpy2.mpz(self.n)
+        self._n_bytes = (self.n.bit_length() + 7) // 8
+        self._password_mpz = gmpy2.mpz(
+            int.from_bytes(self.password_hash, byteorder="big")
+        )
+        self._v = gmpy2.powmod(self._password_mpz, 2, self._n_mpz)
+        self._password_table = None
+        self._password_pow_calls = 0
+
+    def _precompute_password_table(self) -> list:
+        """
+        Precomputes a fixed-base window table for powers of the password.
+
+        Row k holds password^(i * 2^(k * WINDOW_BITS)) mod n for every window
+        digit i, with enough rows to cover a challenge of CHALLENGE_BYTES.
+
+        :return: List of table rows indexed by window digit.
+        """
+        digits = 1 << self.WINDOW_BITS
+        rows = -(-self.CHALLENGE_BYTES * 8 // self.WINDOW_BITS)
+        table = []
+        base = self._password_mpz
+        for _ in range(rows):
+            row = [gmpy2.mpz(1), base]
+            for _ in range(2, digits):
+                row.append(row[-1] * base % self._n_mpz)
+            table.append(row)
+            base = row[-1] * base % self._n_mpz
+        return table
+
+    def _password_pow(self, exponent: int):
+        """
+        Computes password^exponent mod n from the window table when it covers the exponent.
+
+        Building the table costs about as much as WINDOW_TABLE_THRESHOLD plain
+        exponentiations, so the first calls use gmpy2.powmod and the table is
+        only built once an instance has answered that many challenges.
+
+        :param exponent: Non-negative exponent.
+        :return: The power as an mpz.
+        """
+        if exponent.bit_length() > self.CHALLENGE_BYTES * 8:
+            return gmpy2.powmod(self._password_mpz, exponent, self._n_mpz)
+        if self._password_table is None:
+            self._password_pow_calls += 1
+            if self._password_pow_calls <= self.WINDOW_TABLE_THRESHOLD:
+                return gmpy2.powmod(self._password_mpz, exponent, self._n_mpz)
+            self._password_table = self._precompute_password_table()
+        mask = (1 << self.WINDOW_BITS) - 1
+        result = gmpy2.mpz(1)
+        for row in self._password_table:
+            if not exponent:
+                break
+            digit = exponent & mask
+            if digit:
+                result = result * row[digit] % self._n_mpz
+            exponent >>= self.WINDOW_BITS
+        return result
 
     def generate_commitment(self) -> bytes:
         """
@@ -61,22 +172,21 @@ class FiatShamirIdentification:
 
         :return: Commitment value.
         """
-        self.r = secrets.randbits(self.n.bit_length())
-        self.r_squared = pow(self.r, 2, self.n)
-        self.commitment = Hasher.get_hash(
-            self.r_squared.to_bytes(
-                (self.r_squared.bit_length() + 7) // 8, byteorder="big"
-            )
-        )
+        r_bytes = secrets.token_bytes(self._n_bytes + 8)
+        self.r = int.from_bytes(r_bytes, byteorder="big") % self.n
+        self.r_squared = int(gmpy2.powmod(self.r, 2, self._n_mpz))
+        self.commitment = hashlib.sha3_256(
+            self.r_squared.to_bytes(self._n_bytes, byteorder="big")
+        ).digest()
         return self.commitment
 
     def generate_challenge(self) -> bytes:
         """
-        Generates a random challenge of 64 bytes.
+        Generates a random challenge of CHALLENGE_BYTES bytes.
 
         :return: Challenge value.
         """
-        self.challenge = secrets.token_bytes(64)
+        self.challenge = secrets.token_bytes(self.CHALLENGE_BYTES)
         return self.challenge
 
     def compute_response(self, challenge: bytes) -> int:
@@ -87,8 +197,9 @@ class FiatShamirIdentification:
         :return: Response value.
         """
         challenge_int = int.from_bytes(challenge, byteorder="big")
-        password_int = int.from_bytes(self.password_hash, byteorder="big")
-        self.s = (self.r * pow(password_int, challenge_int, self.n)) % self.n
+        self.s = int(
+            gmpy2.mpz(self.r) * self._password_pow(challenge_int) % self._n_mpz
+        )
         return self.s
 
     def verify_response(self, s: int, challenge: bytes) -> bool:
@@ -100,21 +211,24 @@ class FiatShamirIdentification:
         :return: True if the response is valid, False otherwise.
         """
         challenge_int = int.from_bytes(challenge, byteorder="big")
-        password_int = int.from_bytes(self.password_hash, byteorder="big")
-        v = pow(s, 2, self.n)
+        v = gmpy2.powmod(s, 2, self._n_mpz)
         expected_v = (
-            self.r_squared * pow(password_int, 2 * challenge_int, self.n)
-        ) % self.n
+            self.r_squared * gmpy2.powmod(self._v, challenge_int, self._n_mpz)
+        ) % self._n_mpz
         return v == expected_v
 
 
-def rotate_key(key_pair: KeyPair):
+def rotate_key(key_pair: KeyPair, prefetch: bool = False):
     """
     Rotates the RSA key pair.
 
     :param key_pair: KeyPair object to be rotated.
+    :param prefetch: Whether to start generating the following key in the
+        background, so the next rotation does not wait on prime generation.
     """
     key_pair.generate_keypair()
+    if prefetch:
+        key_pair.prefetch_keypair()
 
 
 def initialize_fiat_shamir(password: str) -> Tuple[FiatShamirIdentification, KeyPair]:
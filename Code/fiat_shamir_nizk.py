@@ -1,6 +1,7 @@
 import hashlib
 import secrets
 
+import gmpy2
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import dh
@@ -42,6 +43,24 @@ class FiatShamirNIZK:
         publicKey = self.zkpPublicKey.public_numbers().y
         return primeModulus, generator, publicKey, privateKey
 
+    def zkpChallengeHash(self, primeModulus, userInput, yValue):
+        """
+        Derives the Fiat-Shamir challenge from the user input and commitment.
+
+        Args:
+        primeModulus (int): Prime modulus.
+        userInput (str): User input.
+        yValue (int): Commitment value.
+
+        Returns:
+        int: The challenge as an integer.
+        """
+        modulusBytes = (primeModulus.bit_length() + 7) // 8
+        digest = hashlib.sha3_256(
+            userInput.encode("utf-8") + yValue.to_bytes(modulusBytes, byteorder="big")
+        ).digest()
+        return int.from_bytes(digest, byteorder="big")
+
     def zkpProverAlgorithm(self, primeModulus, generator, privateKey, userInput):
         """
         Prover's algorithm for the Fiat-Shamir NIZK system.
@@ -57,10 +76,7 @@ class FiatShamirNIZK:
         """
         randomValue = secrets.randbelow(primeModulus - 1)
         yValue = pow(generator, randomValue, primeModulus)
-        hashInput = int.from_bytes(
-            hashlib.sha3_256(str(userInput + str(yValue)).encode()).digest(),
-            byteorder="big",
-        )
+        hashInput = self.zkpChallengeHash(primeModulus, userInput, yValue)
         zValue = (randomValue - privateKey * hashInput) % (primeModulus - 1)
         return yValue, zValue
 
@@ -81,19 +97,16 @@ class FiatShamirNIZK:
         bool: True if the proof is valid, False otherwise.
         """
         yValue, zValue = proof
-        hashInput = int.from_bytes(
-            hashlib.sha3_256(str(userInput + str(yValue)).encode()).digest(),
-            byteorder="big",
-        )
+        if not (0 < yValue < primeModulus and 0 <= zValue < primeModulus - 1):
+            return False
+        hashInput = self.zkpChallengeHash(primeModulus, userInput, yValue)
+        if not 0 <= hashInput < primeModulus - 1:
+            return False
         return (
-            pow(generator, zValue, primeModulus)
-            * pow(publicKey, hashInput, primeModulus)
+            gmpy2.powmod(generator, zValue, primeModulus)
+            * gmpy2.powmod(publicKey, hashInput, primeModulus)
             % primeModulus
             == yValue
-            if 0 < yValue < primeModulus
-            and 0 <= zValue < primeModulus - 1
-            and 0 <= hashInput < primeModulus - 1
-            else False
         )
 
 
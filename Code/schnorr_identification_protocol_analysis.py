@@ -1,15 +1,22 @@
-import random
-import string
+import hashlib
+import multiprocessing
+import secrets
 import timeit
-from typing import List, Optional
+from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 import seaborn as sns
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+
+# Backend, curve and hash instances shared by every protocol run.
+BACKEND = default_backend()
+CURVE = ec.SECP256R1()
+HASH_ALGORITHM = hashes.SHA3_256()
+SIGNATURE_ALGORITHM = ec.ECDSA(Prehashed(HASH_ALGORITHM))
 
 
 def generate_random_unicode_string(length: int = 512) -> str:
@@ -22,7 +29,7 @@ def generate_random_unicode_string(length: int = 512) -> str:
     Returns:
     - str: Random Unicode string.
     """
-    return "".join(random.choices(string.printable, k=length))
+    return secrets.token_urlsafe(length)[:length]
 
 
 class SchnorrProtocol:
@@ -45,7 +52,7 @@ class SchnorrProtocol:
         Returns:
         - tuple: A tuple containing the private key and public key.
         """
-        private_key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+        private_key = ec.generate_private_key(CURVE, BACKEND)
         public_key = private_key.public_key()
         return private_key, public_key
 
@@ -56,7 +63,7 @@ class SchnorrProtocol:
         Returns:
         - bytes: Random nonce.
         """
-        nonce_private_key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+        nonce_private_key = ec.generate_private_key(CURVE, BACKEND)
         nonce = nonce_private_key.public_key().public_bytes(
             encoding=serialization.Encoding.X962,
             format=serialization.PublicFormat.CompressedPoint,
@@ -64,13 +71,13 @@ class SchnorrProtocol:
         return nonce
 
     def create_challenge(
-        self, password: str, nonce: bytes, public_key: ec.EllipticCurvePublicKey
+        self, password: bytes, nonce: bytes, public_key: ec.EllipticCurvePublicKey
     ) -> bytes:
         """
         Creates a challenge for the identification protocol.
 
         Args:
-        - password (str): The password.
+        - password (bytes): The UTF-8 encoded password.
         - nonce (bytes): The nonce.
         - public_key (ec.EllipticCurvePublicKey): The public key.
 
@@ -78,7 +85,7 @@ class SchnorrProtocol:
         - bytes: The challenge.
         """
         challenge = (
-            password.encode("utf-8")
+            password
             + nonce
             + public_key.public_bytes(
                 encoding=serialization.Encoding.X962,
@@ -97,11 +104,7 @@ class SchnorrProtocol:
         Returns:
         - bytes: The hashed challenge.
         """
-        hash_function = hashes.SHA3_256()
-        hasher = hashes.Hash(hash_function, default_backend())
-        hasher.update(challenge)
-        hashed_challenge = hasher.finalize()
-        return hashed_challenge
+        return hashlib.sha3_256(challenge).digest()
 
     def sign_challenge(
         self, private_key: ec.EllipticCurvePrivateKey, hashed_challenge: bytes
@@ -116,7 +119,7 @@ class SchnorrProtocol:
         Returns:
         - bytes: The signature.
         """
-        signature = private_key.sign(hashed_challenge, ec.ECDSA(hashes.SHA3_256()))
+        signature = private_key.sign(hashed_challenge, SIGNATURE_ALGORITHM)
         return signature
 
     def verify_signature(
@@ -137,55 +140,83 @@ class SchnorrProtocol:
         - bool: True if the signature is valid, False otherwise.
         """
         try:
-            public_key.verify(signature, hashed_challenge, ec.ECDSA(hashes.SHA3_256()))
+            public_key.verify(signature, hashed_challenge, SIGNATURE_ALGORITHM)
             return True
         except Exception as e:
             print(f"Verification failed: {e}")
             return False
 
 
-def schnorr_protocol_execution_time(
-    password: str, ecc_bits: int, sample_size: int
-) -> List[float]:
+def _one_sample(password: bytes, ecc_bits: int) -> Optional[float]:
     """
-    Measure the execution time of the Schnorr protocol for a given ECC key size.
+    Run the Schnorr protocol once and time the sign/verify step.
 
     Args:
-    - password (str): The password for the identification protocol.
+    - password (bytes): The UTF-8 encoded password.
     - ecc_bits (int): The number of bits in the ECC key.
-    - sample_size (int): The number of samples to collect for statistics.
 
     Returns:
-    - List[float]: A list of execution times for each sample.
+    - Optional[float]: The execution time, or None if verification failed.
     """
     protocol = SchnorrProtocol()
-    execution_times = []
+    private_key, public_key = protocol.generate_key_pair()
+    nonce = protocol.generate_nonce()
+    challenge = protocol.create_challenge(password, nonce, public_key)
+    hashed_challenge = protocol.hash_challenge(challenge)
+
+    start_time = timeit.default_timer()
+    signature = protocol.sign_challenge(private_key, hashed_challenge)
+    verified = protocol.verify_signature(public_key, signature, hashed_challenge)
+    end_time = timeit.default_timer()
+
+    if not verified:
+        print("Verification failed. Skipping time measurement.")
+        return None
+    return end_time - start_time
 
-    for _ in range(sample_size):
-        private_key, public_key = protocol.generate_key_pair()
-        nonce = protocol.generate_nonce()
-        challenge = protocol.create_challenge(password, nonce, public_key)
-        hashed_challenge = protocol.hash_challenge(challenge)
 
-        start_time = timeit.default_timer()
-        signature = protocol.sign_challenge(private_key, hashed_challenge)
-        verified = protocol.verify_signature(public_key, signature, hashed_challenge)
-        end_time = timeit.default_timer()
+def schnorr_protocol_execution_time(
+    password: str, ecc_bits: int, sample_size: int, processes: int = 1
+) -> np.ndarray:
+    """
+    Measure the execution time of the Schnorr protocol for a given ECC key size.
+
+    Samples are independent, so they can be spread across several worker
+    processes. Timings taken in parallel are not comparable to serial ones:
+    workers share cores and clock limits, which shifts the mean and standard
+    deviation. Keep processes at 1 when comparing against earlier runs, and
+    do not exceed the number of physical cores otherwise.
+
+    Args:
+    - password (str): The password for the identification protocol.
+    - ecc_bits (int): The number of bits in the ECC key.
+    - sample_size (int): The number of samples to collect for statistics.
+    - processes (int): The number of worker processes; 1 runs in-process.
 
-        if not verified:
-            print("Verification failed. Skipping time measurement.")
-            continue
-        execution_time = end_time - start_time
-        execution_times.append(execution_time)
-    return execution_times
+    Returns:
+    - np.ndarray: The execution time of each sample that verified.
+    """
+    password_bytes = password.encode("utf-8")
+    if processes == 1:
+        samples = [_one_sample(password_bytes, ecc_bits) for _ in range(sample_size)]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            samples = pool.starmap(
+                _one_sample,
+                [(password_bytes, ecc_bits)] * sample_size,
+                chunksize=1024,
+            )
+    return np.array(
+        [sample for sample in samples if sample is not None], dtype=np.float64
+    )
 
 
-def print_statistics(execution_times: List[float], ecc_bits: int) -> None:
+def print_statistics(execution_times: np.ndarray, ecc_bits: int) -> None:
     """
     Print statistics of execution times.
 
     Args:
-    - execution_times (List[float]): List of execution times.
+    - execution_times (np.ndarray): Array of execution times.
     - ecc_bits (int): The number of bits in the ECC key.
 
     Returns:
@@ -200,13 +231,13 @@ def print_statistics(execution_times: List[float], ecc_bits: int) -> None:
 
 
 def plot_execution_times(
-    execution_times: List[float], sample_size: int, ecc_bits: int
+    execution_times: np.ndarray, sample_size: int, ecc_bits: int
 ) -> None:
     """
     Plot the execution times.
 
     Args:
-    - execution_times (List[float]): List of execution times.
+    - execution_times (np.ndarray): Array of execution times.
     - sample_size (int): The number of samples.
     - ecc_bits (int): The number of bits in the ECC key.
 
@@ -216,11 +247,20 @@ def plot_execution_times(
     sns.set(style="whitegrid")
     plt.figure(figsize=(10, 6))
 
+    # Thinning to at most 1000 log-spaced samples to keep the plot light
+
+    indices = np.arange(1, len(execution_times) + 1)
+    if len(execution_times) > 0:
+        num_points = min(sample_size, 1000)
+        indices = np.unique(
+            np.geomspace(1, len(execution_times), num=num_points).astype(int)
+        )
+
     # Plotting the execution times with a logarithmic scale on the x-axis
 
     plt.plot(
-        np.arange(1, len(execution_times) + 1),
-        execution_times,
+        indices,
+        np.asarray(execution_times)[indices - 1],
         label=f"ECC {ecc_bits} bits",
         marker="o",
     )
@@ -262,9 +302,7 @@ if __name__ == "__main__":
     # Test for ECC key sizes of 192, 224, 256, 384, and 521 bits
 
     ecc_bits_list = [192, 224, 256, 384, 521]
-    all_execution_times = []
 
-    data = {"ECC Key Size": [], "Execution Time": []}
     for ecc_bits in ecc_bits_list:
         password = generate_random_unicode_string()
         execution_times = schnorr_protocol_execution_time(
@@ -278,11 +316,3 @@ if __name__ == "__main__":
         # Plot the execution times
 
         plot_execution_times(execution_times, sample_size, ecc_bits)
-
-        # Store data for correlation scatterplot
-
-        data["ECC Key Size"].extend([ecc_bits] * sample_size)
-        data["Execution Time"].extend(execution_times)
-    # Create a DataFrame for correlation scatterplot
-
-    df = pd.DataFrame(data)
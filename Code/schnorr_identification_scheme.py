@@ -1,6 +1,14 @@
 import hashlib
 import secrets
 
+import gmpy2
+
+# Group parameters returned by keyGeneration.
+PRIME_MODULUS = (
+    115792089237316195423570985008687907853269984665640564039457584007913129639747
+)
+GENERATOR = 5
+
 
 def keyGeneration():
     """
@@ -10,15 +18,32 @@ def keyGeneration():
     tuple: A tuple containing the prime modulus (`primeModulus`), generator (`generator`),
     public key (`publicKey`), and private key (`privateKey`).
     """
-    primeModulus = (
-        115792089237316195423570985008687907853269984665640564039457584007913129639747
-    )
-    generator = 5
+    primeModulus = PRIME_MODULUS
+    generator = GENERATOR
     privateKey = secrets.randbits(256) % (primeModulus - 1) + 1
-    publicKey = pow(generator, privateKey, primeModulus)
+    publicKey = int(gmpy2.powmod(generator, privateKey, primeModulus))
     return primeModulus, generator, publicKey, privateKey
 
 
+def challengeHash(primeModulus, userInput, yValue):
+    """
+    Derives the challenge from the user input and commitment.
+
+    Args:
+    primeModulus (int): Prime modulus.
+    userInput (str): User input (e.g., password).
+    yValue (int): Commitment value.
+
+    Returns:
+    int: The challenge as an integer.
+    """
+    modulusBytes = (primeModulus.bit_length() + 7) // 8
+    digest = hashlib.sha256(
+        str(userInput).encode("utf-8") + yValue.to_bytes(modulusBytes, byteorder="big")
+    ).digest()
+    return int.from_bytes(digest, byteorder="big")
+
+
 def proverAlgorithm(primeModulus, generator, privateKey, userInput):
     """
     Prover's algorithm for the Schnorr-like identification scheme.
@@ -33,11 +58,8 @@ def proverAlgorithm(primeModulus, generator, privateKey, userInput):
     tuple: A tuple containing the proof values (y, z).
     """
     randomValue = secrets.randbits(256) % (primeModulus - 1) + 1
-    yValue = pow(generator, randomValue, primeModulus)
-    hashInput = int.from_bytes(
-        hashlib.sha256((str(userInput) + str(yValue)).encode()).digest(),
-        byteorder="big",
-    )
+    yValue = int(gmpy2.powmod(generator, randomValue, primeModulus))
+    hashInput = challengeHash(primeModulus, userInput, yValue)
     zValue = (randomValue - privateKey * hashInput) % (primeModulus - 1)
     return yValue, zValue
 
@@ -57,13 +79,12 @@ def verifierAlgorithm(primeModulus, generator, publicKey, userInput, proof):
     bool: True if the proof is valid, False otherwise.
     """
     yValue, zValue = proof
-    hashInput = int.from_bytes(
-        hashlib.sha256((str(userInput) + str(yValue)).encode()).digest(),
-        byteorder="big",
-    )
+    if not 0 < yValue < primeModulus:
+        return False
+    hashInput = challengeHash(primeModulus, userInput, yValue)
     return (
-        pow(generator, zValue, primeModulus)
-        * pow(publicKey, hashInput, primeModulus)
+        gmpy2.powmod(generator, zValue, primeModulus)
+        * gmpy2.powmod(publicKey, hashInput, primeModulus)
         % primeModulus
         == yValue
     )